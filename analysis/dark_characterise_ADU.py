@@ -25,7 +25,8 @@ save_to_maps = savefolder/"dark_current_map_ADU.pdf"
 save_to_histogram = savefolder/"dark_current_histogram_ADU.pdf"
 
 # Load the data
-dark_current = np.load(file)
+# The map is memory-mapped so it is only read from disk as needed
+dark_current = np.load(file, mmap_mode="r")
 print("Loaded data")
 
 # Convolve the map with a Gaussian kernel and plot an image of the result
@@ -42,6 +43,8 @@ print(f"Saved RGB histogram to '{save_to_histogram}'")
 
 # Check how many pixels are over some threshold in dark current
 threshold = 50
-pixels_over_threshold = np.where(np.abs(dark_current) > threshold)
-number_over_threshold = len(pixels_over_threshold[0])
+# This is done in chunks to avoid creating full-size temporary arrays, and by
+# comparing to +-threshold so no temporary array of absolute values is needed
+chunks = np.array_split(dark_current.ravel(), 64)
+number_over_threshold = sum(np.count_nonzero(chunk > threshold) + np.count_nonzero(chunk < -threshold) for chunk in chunks)
 print(f"There are {number_over_threshold} pixels with a dark current >{threshold} normalised ADU/s.")
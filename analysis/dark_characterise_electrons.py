@@ -27,7 +27,8 @@ save_to_maps = savefolder/"dark_current_map_electrons.pdf"
 save_to_histogram = savefolder/"dark_current_histogram_electrons.pdf"
 
 # Load the data
-dark_current_normADU = np.load(file)
+# The map is memory-mapped so it is only read from disk as needed
+dark_current_normADU = np.load(file, mmap_mode="r")
 print("Loaded data")
 
 # Convert the data to photoelectrons per second
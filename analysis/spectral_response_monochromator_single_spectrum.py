@@ -28,6 +28,7 @@ savefolder = camera.filename_analysis("spectral_response", makefolders=True)
 save_to_spectrum = savefolder/f"monochromator_{label}_spectrum.pdf"
 save_to_covariance = savefolder/f"monochromator_{label}_covariance.pdf"
 save_to_correlation = savefolder/f"monochromator_{label}_correlation.pdf"
+save_to_correlation_example = savefolder/f"monochromator_{label}_correlation_example.pdf"
 save_to_spectrum_G = savefolder/f"monochromator_{label}_spectrum_RGB.pdf"
 save_to_covariance_G = savefolder/f"monochromator_{label}_covariance_RGB.pdf"
 save_to_correlation_G = savefolder/f"monochromator_{label}_correlation_RGB.pdf"
@@ -37,20 +38,22 @@ save_to_correlation_diff = savefolder/f"monochromator_{label}_correlation_differ
 wavelengths, *_, means_RGBG2 = spectral.load_monochromator_data(camera, folder, flatfield=True)
 
 # Reshape array
-# First remove the spatial information
-means_flattened = np.reshape(means_RGBG2, (len(wavelengths), 4, -1))
-# Then swap the wavelength and filter axes
-means_flattened = np.swapaxes(means_flattened, 0, 1)
-# Finally, flatten the array further
-means_flattened = np.reshape(means_flattened, (4*len(wavelengths), -1))
+# Swap the wavelength and filter axes, then flatten into one row per
+# filter/wavelength combination, with the spatial information along the
+# columns. This is done in a single contiguous copy.
+means_flattened = np.reshape(np.swapaxes(means_RGBG2, 0, 1), (4*len(wavelengths), -1))
 
 # Indices to select R, G, B, and G2
 R, G, B, G2 = [np.s_[len(wavelengths)*j : len(wavelengths)*(j+1)] for j in range(4)]
 RGBG2 = [R, G, B, G2]
 
 # Calculate mean SRF and covariance between all elements
+# The covariance is calculated directly from the centred data with a single
+# matrix product, rather than through np.cov
 srf = np.nanmean(means_flattened, axis=1)
-srf_cov = np.cov(means_flattened)
+means_centred = means_flattened - srf[:, np.newaxis]
+srf_cov = means_centred @ means_centred.T
+srf_cov /= means_flattened.shape[1] - 1
 
 # Calculate the variance (ignoring covariance) from the diagonal elements
 srf_var = np.diag(srf_cov)
@@ -80,19 +83,17 @@ plt.xlabel("Wavelength [nm]")
 plt.ylabel("Correlation")
 plt.xlim(wavelengths[0], wavelengths[-1])
 plt.grid(ls="--")
-plt.show()
-plt.close()
+plot.save_or_show(save_to_correlation_example)
 
 # Calculate mean of G and G2
-I = np.eye(len(wavelengths))
-M_G_G2 = np.zeros((len(wavelengths)*3, len(wavelengths)*4))
-M_G_G2[R,R] = I
-M_G_G2[B,B] = I
-M_G_G2[G,G] = 0.5*I
-M_G_G2[G,G2] = 0.5*I
-
-srf_G = M_G_G2 @ srf
-srf_cov_G = M_G_G2 @ srf_cov @ M_G_G2.T
+# The SRF and covariance are split into (4, W) and (4, W, 4, W) blocks so the
+# RGBG2 -> RGB conversion only touches the colour axes, rather than building a
+# mostly empty (3W, 4W) conversion matrix
+srf_G = spectral.convert_RGBG2_to_RGB(np.reshape(srf, (4, -1)), axis=0).ravel()
+srf_cov_blocks = np.reshape(srf_cov, (4, len(wavelengths), 4, len(wavelengths)))
+srf_cov_blocks = spectral.convert_RGBG2_to_RGB(srf_cov_blocks, axis=0)
+srf_cov_blocks = spectral.convert_RGBG2_to_RGB(srf_cov_blocks, axis=2)
+srf_cov_G = np.reshape(srf_cov_blocks, (3*len(wavelengths), 3*len(wavelengths)))
 
 srf_var_G = np.diag(srf_cov_G)
 
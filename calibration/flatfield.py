@@ -55,8 +55,9 @@ print("Normalised data")
 flatfield_gauss = gauss_filter_multidimensional(mean_normalised, 10)
 
 # Calculate the correction factor
-correction = 1 / flatfield_gauss
-correction_raw = 1 / mean_normalised
+# This is done in place, since the normalised data are not used afterwards
+correction = np.reciprocal(flatfield_gauss, out=flatfield_gauss)
+correction_raw = np.reciprocal(mean_normalised, out=mean_normalised)
 
 # Save the correction factor maps
 np.save(save_to_correction, correction)
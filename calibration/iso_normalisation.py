@@ -46,9 +46,15 @@ assert isos.min() == camera.settings.ISO_min, f"Lowest ISO speed in the data ({i
 
 # Convert the mean values at each ISO to normalised units, compared to the
 # lowest ISO speed
-ratios = means / means[isos.argmin()]
-ratios_mean = ratios.mean(axis=(1,2))
-ratios_errs = ratios.std (axis=(1,2))
+# This is done one ISO speed at a time, so only one image of ratios is kept in
+# memory at once
+reciprocal_lowest_iso = 1 / means[isos.argmin()]
+ratios_mean = np.empty(len(isos))
+ratios_errs = np.empty(len(isos))
+for i, mean in enumerate(means):
+    ratios = mean * reciprocal_lowest_iso
+    ratios_mean[i] = ratios.mean()
+    ratios_errs[i] = ratios.std()
 print(f"Normalised data to minimum ISO ({camera.settings.ISO_min})")
 
 # Fit a model to the ISO normalisation curve
@@ -65,7 +65,7 @@ print("Loaded calibration data")
 # Combine the spectral data from each folder into the same format
 all_wavelengths = np.unique(np.concatenate(wavelengths))
 all_means = np.full((len(wavelengths), len(all_wavelengths), 4), np.nan)
-all_stds = all_means.copy()
+all_stds = np.full_like(all_means, np.nan)
 
 # Add the data from the separate spectra into one big array
 # If a spectrum is missing a wavelength, keep that value NaN
@@ -81,21 +81,20 @@ np.save(save_to_stds, all_stds)
 print(f"Saved raw curves to {savefolder}")
 
 # Calibrate the data
-# First, create a copy of the array to put the calibrated data into
-all_means_calibrated = np.full(all_means.shape, np.nan)
-all_stds_calibrated = all_means_calibrated.copy()
-
-# Loop over the spectra
-for i, (mean, std, cal) in enumerate(zip(all_means, all_stds, cals)):
+# First, put the calibration data into one table with the same wavelengths as
+# the data, keeping wavelengths without calibration data NaN
+cal_table = np.full((len(cals), len(all_wavelengths)), np.nan)
+for cal_row, cal in zip(cal_table, cals):
     # Find the overlapping wavelengths between calibration and data
-    _, cal_indices, all_wavelengths_indices = np.intersect1d(cal[0], all_wavelengths, return_indices=True)
-
-    # Calibrate the data and store it in the main array
-    all_means_calibrated[i, all_wavelengths_indices] = mean[all_wavelengths_indices] / cal[1, cal_indices, np.newaxis]
+    indices = np.searchsorted(all_wavelengths, cal[0]).clip(max=len(all_wavelengths)-1)
+    overlapping = (all_wavelengths[indices] == cal[0])
+    cal_row[indices[overlapping]] = cal[1, overlapping]
 
-    # Assume the error in the result is dominated by the error in the data,
-    # not in the calibration (strong assumption!) and propagate the error
-    all_stds_calibrated[i, all_wavelengths_indices] = std[all_wavelengths_indices] / cal[1, cal_indices, np.newaxis]
+# Calibrate all the data at once
+# Assume the error in the result is dominated by the error in the data,
+# not in the calibration (strong assumption!) and propagate the error
+all_means_calibrated = all_means / cal_table[..., np.newaxis]
+all_stds_calibrated = all_stds / cal_table[..., np.newaxis]
 
 # Save the calibrated curves to file
 np.save(save_to_means_calibrated, all_means_calibrated)
@@ -144,8 +143,9 @@ for i in normalise_order:
 
     # Fit a parabolic function to the ratio between the spectra where they overlap
     ind = ~np.isnan(ratios[:,0])
+    # Both the fit and its evaluation are done for all channels at once
     fits = np.polyfit(all_wavelengths[ind], ratios[ind], 2)
-    fit_norms = np.array([np.polyval(f, all_wavelengths) for f in fits.T]).T
+    fit_norms = np.polynomial.polynomial.polyval(all_wavelengths, fits[::-1]).T
 
     # Normalise by dividing the spectrum by this parabola
     all_means_normalised[i] = all_means_calibrated[i] / fit_norms
@@ -160,24 +160,25 @@ print(f"Saved normalised curves to {savefolder}")
 # Calculate the signal-to-noise ratio (SNR) at each wavelength in each spectrum
 SNR = all_means_normalised / all_stds_normalised
 
-# Mask NaN data
-mean_mask = np.ma.array(all_means_normalised, mask=np.isnan(all_means_normalised))
-stds_mask = np.ma.array(all_stds_normalised , mask=np.isnan(all_stds_normalised ))
-SNR_mask  = np.ma.array(SNR                 , mask=np.isnan(SNR                 ))
-
 # Calculate the weight of each spectrum at each wavelength, based on the SNR
-weights = SNR_mask**2
+# NaN data are given a weight of 0
+weights = np.nan_to_num(SNR, nan=0)**2
+weights_sum = weights.sum(axis=0)
 
 # Calculate the weighted average (and its error) per wavelength
-flat_means_mask = np.ma.average(mean_mask, axis=0, weights=weights)
-flat_errs_mask = np.sqrt(np.ma.sum((weights/weights.sum(axis=0) * stds_mask)**2, axis=0))
+# Wavelengths without any data are set to 0, as with np.ma.average
+has_data = weights_sum > 0
+flat_means = np.divide((weights * np.nan_to_num(all_means_normalised, nan=0)).sum(axis=0), weights_sum, out=np.zeros_like(weights_sum), where=has_data)
+weights_normalised = np.divide(weights, weights_sum, out=np.zeros_like(weights), where=has_data)
+flat_errs = np.sqrt(((weights_normalised * np.nan_to_num(all_stds_normalised, nan=0))**2).sum(axis=0))
 
 # Calculate the SNR of the resulting spectrum
-SNR_final = flat_means_mask / flat_errs_mask
+with np.errstate(invalid="ignore", divide="ignore"):
+    SNR_final = flat_means / flat_errs
 
-# Remove the mask from the final data set
-response_normalised = (flat_means_mask / flat_means_mask.max()).data
-errors_normalised = (flat_errs_mask / flat_means_mask.max()).data
+# Normalise the final data set
+response_normalised = flat_means / flat_means.max()
+errors_normalised = flat_errs / flat_means.max()
 
 # Combine the result into one big array and save it
 result = np.array(np.stack([all_wavelengths, *response_normalised.T, *errors_normalised.T]))
@@ -74,9 +74,15 @@ def adjust_band_wavelengths(band_wavelengths, band_response, data_wavelengths):
     """
     Clip a spectral band `band_response` over wavelengths `band_wavelengths` to only
     include elements within the given `data_wavelengths`
+
+    If the `band_wavelengths` are sorted, the range is found with a binary search
+    and the results are views; otherwise, a mask is used.
     """
     left, right = data_wavelengths[0], data_wavelengths[-1]
-    indices = np.where((band_wavelengths >= left) & (band_wavelengths <= right))
+    if np.all(np.diff(band_wavelengths) >= 0):
+        indices = np.s_[np.searchsorted(band_wavelengths, left, side="left"):np.searchsorted(band_wavelengths, right, side="right")]
+    else:
+        indices = np.where((band_wavelengths >= left) & (band_wavelengths <= right))
     new_wavelengths = band_wavelengths[indices]
     new_response = band_response[indices]
     return new_wavelengths, new_response
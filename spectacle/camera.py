@@ -7,12 +7,19 @@ The Camera object also provides an easy interface for data calibration/correctio
 import numpy as np
 import json
 from collections import namedtuple
+from functools import lru_cache
 from pathlib import Path
 from os import makedirs
 
 from . import raw, analyse, bias_readnoise, dark, iso, gain, flat, spectral
 from .general import return_with_filename, find_matching_file
 
+# Use orjson for reading JSON files if available, since it is faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Empty slice that just selects all data - used as default argument
 all_data = np.s_[:]
@@ -105,6 +112,32 @@ def _convert_exposure_time(exposure):
             return exposure_new
 
 
+# Camera settings, namely the ranges of ISO speeds and exposure times
+Settings = namedtuple("Settings", ["ISO_min", "ISO_max", "exposure_min", "exposure_max"])
+
+
+def _tile_bayer_pattern(image_shape, pattern):
+    """
+    Tile a 2x2 array `pattern` over an image with a given `image_shape`,
+    rounding up for odd image shapes and cutting off the excess afterwards.
+    """
+    nr_tiles = ((image_shape[0]+1)//2, (image_shape[1]+1)//2)
+    return np.tile(pattern, nr_tiles)[:image_shape[0], :image_shape[1]]
+
+
+@lru_cache(maxsize=8)
+def _build_bayer_map(image_shape, bayer_pattern):
+    """
+    Generate a Bayer map, with the Bayer channel (RGBG2) for each pixel, for
+    a given `image_shape` and 2x2 `bayer_pattern` (both tuples).
+
+    The results are cached, so the returned map is made read-only.
+    """
+    bayer_map = _tile_bayer_pattern(image_shape, np.array(bayer_pattern, dtype=np.uint8))
+    bayer_map.setflags(write=False)
+    return bayer_map
+
+
 class Camera(object):
     """
     Object that represents a camera, storing its important properties and providing
@@ -112,7 +145,6 @@ class Camera(object):
     """
     # Properties a Camera can have
     property_list = ["name", "manufacturer", "name_internal", "image_shape", "raw_extension", "bias", "bayer_pattern", "bit_depth", "colour_description"]
-    _Settings = namedtuple("Settings", ["ISO_min", "ISO_max", "exposure_min", "exposure_max"])
 
     calibration_data_all = ["settings", "bias_map", "readnoise", "dark_current", "iso_lookup_table", "gain_map", "flatfield_map", "spectral_response", "spectral_bands", "XYZ_matrix"]
 
@@ -137,15 +169,17 @@ class Camera(object):
         self.root = root
 
         # Generate/calculate commonly used values/properties
-        self.bayer_map = self._generate_bayer_map()
+        # The Bayer map is generated on first use, see `Camera.bayer_map`
         self.saturation = 2**self.bit_depth - 1
         self.bands = self.colour_description
 
         # Load settings if available
-        try:
-            self.load_settings()
-        except FileNotFoundError:
-            pass
+        # Without a root folder there is nothing to look for
+        if self.root is not None:
+            try:
+                self.load_settings()
+            except FileNotFoundError:
+                pass
 
     def __repr__(self):
         """
@@ -177,20 +211,47 @@ class Camera(object):
         """
         Generate a dictionary containing the Camera metadata, similar to the
         inputs to __init__.
+
+        The dictionary is only generated once and re-used afterwards, since
+        the metadata do not change after the Camera object is created.
+        A shallow copy is returned, so callers cannot change the cached one.
+        """
+        # If the dictionary has not been generated yet, do so
+        if not hasattr(self, "_dictionary"):
+            self._dictionary = {prop: getattr(self, prop) for prop in self.property_list}
+
+        return dict(self._dictionary)
+
+    @property
+    def bayer_map(self):
         """
-        dictionary = {prop: getattr(self, prop) for prop in self.property_list}
-        return dictionary
+        Bayer map, with the Bayer channel (RGBG2) for each pixel.
+        This is only generated when it is first used, and cached afterwards.
+        """
+        return self._generate_bayer_map()
 
     def _generate_bayer_map(self):
         """
         Generate a Bayer map, with the Bayer channel (RGBG2) for each pixel.
+        The map is shared between all Camera objects with the same image shape
+        and Bayer pattern, so it is read-only.
+        """
+        image_shape = tuple(self.image_shape)
+        bayer_pattern = tuple(map(tuple, self.bayer_pattern))
+        return _build_bayer_map(image_shape, bayer_pattern)
+
+    def channel_mask(self, channels):
         """
-        bayer_map = np.zeros(self.image_shape, dtype=int)
-        bayer_map[0::2, 0::2] = self.bayer_pattern[0][0]
-        bayer_map[0::2, 1::2] = self.bayer_pattern[0][1]
-        bayer_map[1::2, 0::2] = self.bayer_pattern[1][0]
-        bayer_map[1::2, 1::2] = self.bayer_pattern[1][1]
-        return bayer_map
+        Generate a boolean map that is True for pixels in any of the given
+        Bayer `channels`, e.g. [1, 3] for G and G2.
+
+        This is equivalent to combining `bayer_map == channel` for each of the
+        `channels`, but only the 2x2 Bayer pattern is compared, so no full
+        Bayer map needs to be scanned.
+        """
+        pattern_mask = np.isin(self.bayer_pattern, channels)
+        mask = _tile_bayer_pattern(self.image_shape, pattern_mask)
+        return mask
 
     def central_slice(self, width_x, width_y):
         """
@@ -198,7 +259,7 @@ class Camera(object):
         width_x, width_y. Note that there may be rounding errors for odd widths.
         """
         dx, dy = width_x//2, width_y//2
-        midx, midy = np.array(self.image_shape)//2
+        midx, midy = self.image_shape[0]//2, self.image_shape[1]//2
         center = np.s_[..., midx-dx:midx+dx, midy-dy:midy+dy]
         return center
 
@@ -206,24 +267,14 @@ class Camera(object):
         """
         Load a settings file
         """
-        filename = find_matching_file(self.root/"calibration", "settings.json")
-        settings = load_json(filename)
-
-        # Convert the input exposures to floating point numbers
-        settings["exposure_min"] = _convert_exposure_time(settings["exposure_min"])
-        settings["exposure_max"] = _convert_exposure_time(settings["exposure_max"])
-
-        # Add settings to the camera
-        self.settings = self._Settings(**settings)
+        self.settings = load_settings(self.root)
 
     def generate_bias_map(self):
         """
         Generate a Bayer-aware map of bias values from the camera information.
         """
-        bayer_map = self._generate_bayer_map()
-        for j, bias_value in enumerate(self.bias):
-            bayer_map[bayer_map == j] = bias_value
-        return bayer_map
+        bias_map = np.array(self.bias)[self.bayer_map]
+        return bias_map
 
     def _load_bias_map(self):
         """
@@ -586,13 +637,33 @@ class Camera(object):
         """
         Demosaick data using this camera's Bayer pattern.
         """
-        # Select the relevant data
-        bayer_map = self.bayer_map[selection]
+        # For the full image, only the 2x2 Bayer pattern is needed
+        # The data are checked here, since raw.demosaick_pattern cannot do so
+        if selection is all_data:
+            assert np.shape(data)[-2:] == tuple(self.image_shape), f"The data ({np.shape(data)}) do not match the camera's image shape ({self.image_shape})"
+            RGBG_data = raw.demosaick_pattern(self.bayer_pattern, data, color_desc=self.bands, **kwargs)
+
+        # Otherwise, select the relevant part of the Bayer map
+        else:
+            bayer_map = self.bayer_map[selection]
+            assert np.shape(data)[-2:] == bayer_map.shape, f"The data ({np.shape(data)}) do not match the selection of the Bayer map ({bayer_map.shape})"
+            RGBG_data = raw.demosaick(bayer_map, data, color_desc=self.bands, **kwargs)
 
-        # Demosaick the data
-        RGBG_data = raw.demosaick(bayer_map, data, color_desc=self.bands, **kwargs)
         return RGBG_data
 
+    def subgrid(self, data, channel):
+        """
+        Select the pixels in a single Bayer `channel` (RGBG2, as an index
+        0-3) from mosaicked `data`, using this camera's Bayer pattern.
+
+        The result is a strided view of the `data` along their last two axes,
+        so no data are copied.
+        """
+        # Get the slice for this channel from the 2x2 Bayer pattern
+        channel_slice = raw._bayer_slices(self.bayer_pattern)[channel]
+
+        return data[channel_slice]
+
     def plot_spectral_response(self, **kwargs):
         """
         Plot the camera's spectral response function.
@@ -668,20 +739,37 @@ class Camera(object):
         """
         root = find_root_folder(path)
         properties = load_json(path)
-        return cls(**properties, root=root)
 
+        # Check the properties by name, so a malformed file gives a clear error
+        missing = [prop for prop in cls.property_list if prop not in properties and prop != "colour_description"]
+        unknown = [prop for prop in properties if prop not in cls.property_list]
+        if missing or unknown:
+            raise ValueError(f"Camera information file `{path}` is missing properties {missing} and/or contains unknown properties {unknown}.")
 
-dummy_camera = Camera(name="Dummy", manufacturer="SPECTACLE", name_internal="dummy-123", image_shape=[1080, 1920], raw_extension=".dng", bias=[0,0,0,0], bayer_pattern=[[0,1],[2,3]], bit_depth=11, colour_description="RGBG", root=Path(__file__).parent)
+        camera = cls(**properties, root=root)
+
+        # If the file contains every property, re-use its contents as the
+        # metadata dictionary (see `Camera._as_dict`) instead of re-generating it
+        if len(properties) == len(cls.property_list):
+            camera._dictionary = properties
+
+        return camera
 
 
 def load_json(path):
     """
     Read a JSON file.
     """
-    with open(path, "r") as file:
+    # Read the raw bytes; both json and orjson parse these directly, without
+    # decoding them to a str first
+    with open(path, "rb") as file:
         try:
             # Load the JSON file
-            dump = json.load(file)
+            if orjson is None:
+                dump = json.loads(file.read())
+            else:
+                dump = orjson.loads(file.read())
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
         except json.JSONDecodeError:
             # If the JSON file could not be read, e.g. because it is empty, raise an error
             raise ValueError(f"Could not read JSON file `{path}`.")
@@ -718,3 +806,25 @@ def load_camera(root, return_filename=False):
     filename = find_matching_file(root, "data.json")
     metadata = Camera.read_from_file(filename)
     return return_with_filename(metadata, filename, return_filename)
+
+
+def load_settings(root, return_filename=False):
+    """
+    Read the camera settings JSON located at `root`/calibration/settings.json.
+    This does not require loading the full camera information.
+
+    If `return_filename` is True, also return the exact filename used.
+    """
+    root = Path(root)
+    filename = find_matching_file(root/"calibration", "settings.json")
+    settings = load_json(filename)
+
+    # Convert the input exposures to floating point numbers
+    settings["exposure_min"] = _convert_exposure_time(settings["exposure_min"])
+    settings["exposure_max"] = _convert_exposure_time(settings["exposure_max"])
+
+    settings = Settings(**settings)
+    return return_with_filename(settings, filename, return_filename)
+
+
+dummy_camera = Camera(name="Dummy", manufacturer="SPECTACLE", name_internal="dummy-123", image_shape=[1080, 1920], raw_extension=".dng", bias=[0,0,0,0], bayer_pattern=[[0,1],[2,3]], bit_depth=11, colour_description="RGBG", root=Path(__file__).parent)
@@ -16,12 +16,12 @@ def _gauss_nan(D, sigma=5, **kwargs):
     Apply a multidimensional Gaussian kernel, accounting for NaN values.
     Reference: https://stackoverflow.com/a/36307291/2229219
     """
-    V = D.copy()
-    V[D!=D] = 0
+    nan = np.isnan(D)
+
+    V = np.where(nan, 0., D)
     VV = gaussMd(V, sigma=sigma, **kwargs)
 
-    W = 0 * D.copy() + 1
-    W[D!=D] = 0
+    W = (~nan).astype(D.dtype)
     WW = gaussMd(W, sigma=sigma, **kwargs)
 
     Z=VV/WW
@@ -35,6 +35,9 @@ def gauss_filter_multidimensional(data, sigma=5, **kwargs):
 
     Select `gaussMd` or `_gauss_nan` depending on if NaN data are present
     in the given `data_element`.
+
+    `gaussMd` is separable, applying a 1-D kernel along each axis in turn, so
+    axes with a `sigma` of 0 are skipped entirely.
     """
     func = _gauss_nan if np.isnan(data).any() else gaussMd
     data_gauss = func(data, sigma=sigma, **kwargs)
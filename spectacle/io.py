@@ -2,10 +2,12 @@ import rawpy
 import exifread
 import numpy as np
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from string import ascii_letters
 from pathlib import Path
 from matplotlib import pyplot as plt
-from .camera import load_camera, find_root_folder, load_json, write_json
+from .camera import load_camera, load_settings, find_root_folder, load_json, write_json
 from .general import find_matching_file
 
 # Default save folder for results
@@ -150,6 +152,15 @@ def expected_array_size(folder, pattern):
     return np.array(array.shape)
 
 
+def _load_npy_selection(filename, selection=np.s_[:]):
+    """
+    Load only the elements in `selection` from a .npy file `filename`, using
+    a memory map so the rest of the file is not read from disk.
+    """
+    data = np.load(filename, mmap_mode="r")
+    return np.array(data[selection])
+
+
 def load_npy(folder, pattern, retrieve_value=absolute_filename, selection=np.s_[:], **kwargs):
     """
     Load a series of .npy (NumPy binary) files from `folder` following a
@@ -157,11 +168,15 @@ def load_npy(folder, pattern, retrieve_value=absolute_filename, selection=np.s_[
     list of values based on their parsing their filenames with a function
     given in the `retrieve_value` keyword. Only return array elements included
     in `selection` (default: all).
+
+    The files are memory-mapped, so only the elements in `selection` are read
+    from disk. Multiple files are read in parallel threads.
     """
     # Make sure `folder` is a Path-like object
     folder = Path(folder)
     files = sorted(folder.glob(pattern))
-    stacked = np.stack([np.load(f)[selection] for f in files])
+    with ThreadPoolExecutor() as executor:
+        stacked = np.stack(list(executor.map(_load_npy_selection, files, repeat(selection))))
     values = np.array([retrieve_value(f, **kwargs) for f in files])
     return values, stacked
 
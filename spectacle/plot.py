@@ -201,13 +201,16 @@ def histogram_RGB(data_RGBG, xmin="auto", xmax="auto", nrbins=500, xlabel="", ys
     Can be done on existing Axes if `axs` are passed.
     """
     # Get upper and lower bounds for the axes
-    if xmin == "auto":
-        xmin = symmetric_percentiles(data_RGBG)[0]
-    if xmax == "auto":
-        xmax = symmetric_percentiles(data_RGBG)[1]
+    if xmin == "auto" or xmax == "auto":
+        xmin_auto, xmax_auto = symmetric_percentiles(data_RGBG)
+        xmin = xmin_auto if xmin == "auto" else xmin
+        xmax = xmax_auto if xmax == "auto" else xmax
 
-    # Unravel the data
-    data_KRGB = [data_RGBG.ravel(), data_RGBG[0].ravel(), data_RGBG[1::2].ravel(), data_RGBG[2].ravel()]
+    # Histogram each RGBG2 channel once, then combine the counts into
+    # histograms for all data combined, R, G (G + G2), and B
+    bins = np.linspace(xmin, xmax, nrbins)
+    counts_RGBG = np.array([np.histogram(data, bins=bins)[0] for data in data_RGBG])
+    counts_KRGB = [counts_RGBG.sum(axis=0), counts_RGBG[0], counts_RGBG[1] + counts_RGBG[3], counts_RGBG[2]]
 
     # If no axs were passed, make a new figure
     if axs is None:
@@ -217,8 +220,8 @@ def histogram_RGB(data_RGBG, xmin="auto", xmax="auto", nrbins=500, xlabel="", ys
         newfig = False
 
     # Loop over the different channels and plot them
-    for data, colour, ax in zip(data_KRGB, kRGB_OkabeIto, axs):
-        ax.hist(data, bins=np.linspace(xmin, xmax, nrbins), color=colour, edgecolor=colour, density=True)
+    for counts, colour, ax in zip(counts_KRGB, kRGB_OkabeIto, axs):
+        ax.hist(bins[:-1], bins=bins, weights=counts, color=colour, edgecolor=colour, density=True)
         ax.grid(ls="--")
 
     # Plot settings
@@ -1,4 +1,5 @@
 import numpy as np
+from functools import lru_cache
 
 
 def _generate_bayer_slices(color_pattern, colours=range(4)):
@@ -14,13 +15,48 @@ def _generate_bayer_slices(color_pattern, colours=range(4)):
     return slices
 
 
+@lru_cache(maxsize=None)
+def _bayer_slices_from_pattern(pattern):
+    """
+    Cached version of `_generate_bayer_slices` for a 2x2 `pattern` given as a
+    tuple of tuples, so the slices are only generated once per Bayer pattern.
+    """
+    return _generate_bayer_slices(np.array(pattern))
+
+
+def _bayer_slices(bayer_map):
+    """
+    Get the slices used to demosaick data, based on the top-left 2x2 block of
+    a Bayer map `bayer_map`.
+    """
+    pattern = tuple(map(tuple, np.asarray(bayer_map)[:2, :2].tolist()))
+    return _bayer_slices_from_pattern(pattern)
+
+
+def _demosaick(bayer_data, data):
+    """
+    Demosaick the `data` along their last two axes, using the Bayer pattern
+    in the top-left 2x2 block of `bayer_data`.
+    """
+    slices = _bayer_slices(bayer_data)
+
+    # Combine the data back into one array of shape [..., 4, x/2, y/2]
+    newshape = list(data.shape[:-2]) + [4, data.shape[-2]//2, data.shape[-1]//2]
+    RGBG = np.empty(newshape)
+    for i, s in enumerate(slices):
+        RGBG[..., i, :, :] = data[s]
+
+    return RGBG
+
+
 def demosaick(bayer_map, data, color_desc="RGBG"):
     """
     Uses a Bayer map `bayer_map` (RGBG channel for each pixel) and any number
     of input arrays `data`.
     """
     # Cast the data to a numpy array for the following indexing tricks to work
-    data = np.array(data)
+    # This does not copy data that are already an array
+    data = np.asarray(data)
 
     # Check that we are dealing with RGBG2 data, as only these are supported right now.
     assert color_desc in ("RGBG", b"RGBG"), f"Unknown colour description `{color_desc}"
@@ -29,22 +65,41 @@ def demosaick(bayer_map, data, color_desc="RGBG"):
     assert data.shape[-2:] == bayer_map.shape, f"The data ({data.shape}) and Bayer map ({bayer_map.shape}) have incompatible shapes"
 
     # Demosaick the data along their last two axes
-    bayer_pattern = bayer_map[:2, :2]
-    slices = _generate_bayer_slices(bayer_pattern)
+    RGBG = _demosaick(bayer_map, data)
 
-    # Combine the data back into one array of shape [..., 4, x/2, y/2]
-    newshape = list(data.shape[:-2]) + [4, data.shape[-2]//2, data.shape[-1]//2]
-    RGBG = np.empty(newshape)
-    for i, s in enumerate(slices):
-        RGBG[..., i, :, :] = data[s]
+    return RGBG
+
+
+def demosaick_pattern(bayer_pattern, data, color_desc="RGBG"):
+    """
+    Uses a 2x2 Bayer pattern `bayer_pattern` (RGBG channel for each pixel in
+    the pattern) and any number of input arrays `data`.
+
+    Unlike `demosaick`, no full Bayer map is needed, but this also means the
+    shape of the `data` cannot be checked, so callers should do so themselves.
+    """
+    # Cast the data to a numpy array for the following indexing tricks to work
+    # This does not copy data that are already an array
+    data = np.asarray(data)
+
+    # Check that we are dealing with RGBG2 data, as only these are supported right now.
+    assert color_desc in ("RGBG", b"RGBG"), f"Unknown colour description `{color_desc}"
+
+    # Check that only the 2x2 Bayer pattern was given
+    bayer_pattern = np.asarray(bayer_pattern)
+    assert bayer_pattern.shape == (2, 2), f"The Bayer pattern ({bayer_pattern.shape}) is not 2x2"
+
+    # Demosaick the data along their last two axes
+    RGBG = _demosaick(bayer_pattern, data)
 
     return RGBG
 
 
 def put_together_from_colours(RGBG, colours):
-    original = np.zeros((2*RGBG.shape[1], 2*RGBG.shape[2]))
-    for j in range(4):
-        original[np.where(colours == j)] = RGBG[j].ravel()
+    # Every pixel is filled in from one of the four channels
+    original = np.empty((2*RGBG.shape[1], 2*RGBG.shape[2]))
+    for j, s in enumerate(_bayer_slices(colours)):
+        original[s] = RGBG[j]
     return original
 
 
@@ -55,17 +110,14 @@ def split_RGBG(RGBG):
 
 def to_RGB_array(raw_image, color_pattern):
     RGB = np.zeros((*raw_image.shape, 3))
-    R_ind = np.where(color_pattern == 0)
-    G_ind = np.where((color_pattern == 1) | (color_pattern == 3))
-    B_ind = np.where(color_pattern == 2)
-    RGB[R_ind[0], R_ind[1], 0] = raw_image[R_ind]
-    RGB[G_ind[0], G_ind[1], 1] = raw_image[G_ind]
-    RGB[B_ind[0], B_ind[1], 2] = raw_image[B_ind]
+    # Each Bayer channel is a strided sub-grid of the image; G and G2 both go into G
+    for s, RGB_index in zip(_bayer_slices(color_pattern), [0, 1, 2, 1]):
+        RGB[..., RGB_index][s] = raw_image[s]
     return RGB
 
 
 def multiply_RGBG(data, colours, factors):
     data_new = data.copy()
-    for j in range(4):
-        data_new[colours == j] *= factors[j]
+    for s, factor in zip(_bayer_slices(colours), factors):
+        data_new[s] *= factor
     return data_new
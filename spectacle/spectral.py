@@ -38,7 +38,10 @@ def load_cal_NERC(filename, norm=True):
     with open(filename, "r") as file:
         info = file.readlines()[0].split(",")
     start, stop, step = [float(i) for i in info[3:6]]
-    wavelengths = np.arange(start, stop+step, step)
+    # Use linspace rather than arange to avoid floating-point accumulation
+    # adding or dropping a wavelength at the end
+    number_of_wavelengths = int(round((stop - start) / step)) + 1
+    wavelengths = np.linspace(start, stop, number_of_wavelengths)
     arr = np.stack([wavelengths, data])
     return arr
 
@@ -334,7 +337,7 @@ def calculate_XYZ_matrix(wavelengths, spectral_response):
     # [X_R  X_G  X_B]
     # [Y_R  Y_G  Y_B]
     # [Z_R  Z_G  Z_B]
-    SRF_XYZ_product = np.einsum("xw,rw->xr", cie_xyz, SRF_RGB_interpolated) / len(cie_wavelengths)
+    SRF_XYZ_product = (cie_xyz @ SRF_RGB_interpolated.T) / len(cie_wavelengths)
 
     # Normalise by column
     SRF_xyz = SRF_XYZ_product / SRF_XYZ_product.sum(axis=0)
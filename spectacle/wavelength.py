@@ -12,8 +12,7 @@ degree_of_coefficient_fit = 4
 wavelength_limits = (350, 750)
 
 def find_fluorescent_lines(RGB):
-    RGB_copy = RGB.copy()
-    RGB_copy[np.isnan(RGB_copy)] = -999
+    RGB_copy = np.where(np.isnan(RGB), -999, RGB)
     peaks = np.nanargmax(RGB_copy, axis=2).astype(np.float32)
     peaks[peaks == 0] = np.nan
     return peaks
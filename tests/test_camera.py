@@ -0,0 +1,139 @@
+"""
+Tests for spectacle.camera: creating Camera objects and using their metadata.
+"""
+
+import copy
+import json
+import pickle
+
+import numpy as np
+import pytest
+
+import spectacle
+from spectacle.camera import Camera, Settings, _build_bayer_map, load_camera, load_json, load_settings, write_json
+
+
+camera_info = {"name": "Test camera", "manufacturer": "SPECTACLE", "name_internal": "test-123", "image_shape": [4, 6], "raw_extension": ".dng", "bias": [0, 0, 0, 0], "bayer_pattern": [[0, 1], [2, 3]], "bit_depth": 11, "colour_description": "RGBG"}
+settings_info = {"ISO_min": 50, "ISO_max": 800, "exposure_min": "1/4000", "exposure_max": 2}
+
+
+def test_import():
+    assert spectacle.camera.dummy_camera.name == "Dummy"
+
+
+def test_demosaick_shape(tmp_path):
+    camera = Camera(**camera_info, root=tmp_path)
+    data = np.arange(24).reshape(camera.image_shape)
+    RGBG = camera.demosaick(data)
+    assert RGBG.shape == (4, 2, 3)
+    assert np.array_equal(RGBG[0], data[::2, ::2])
+
+    # A selection is demosaicked with the same part of the Bayer map
+    assert np.array_equal(camera.demosaick(data[1:3, 1:3], selection=np.s_[1:3, 1:3])[0], data[2:3, 2:3])
+
+    # Data that do not match the image shape or selection must be rejected
+    with pytest.raises(AssertionError):
+        camera.demosaick(np.zeros((6, 4)))
+    with pytest.raises(AssertionError):
+        camera.demosaick(np.zeros((4, 4)), selection=np.s_[:2, :2])
+
+
+def test_build_bayer_map():
+    # Odd image shapes are cut off after tiling the pattern
+    bayer_map = _build_bayer_map((3, 5), ((0, 1), (3, 2)))
+    assert bayer_map.dtype == np.uint8
+    assert np.array_equal(bayer_map, [[0, 1, 0, 1, 0], [3, 2, 3, 2, 3], [0, 1, 0, 1, 0]])
+
+    # The map is shared between calls, so it must be read-only
+    assert _build_bayer_map((3, 5), ((0, 1), (3, 2))) is bayer_map
+    with pytest.raises(ValueError):
+        bayer_map[0, 0] = 2
+
+
+def test_json_round_trip(tmp_path):
+    # Files are always written with an indent of 4, as in data_template
+    write_json(camera_info, tmp_path/"camera_data.json")
+    with open(tmp_path/"camera_data.json") as file:
+        assert file.read() == json.dumps(camera_info, indent=4)
+
+    assert load_json(tmp_path/"camera_data.json") == camera_info
+
+
+def test_settings_copy():
+    settings = Settings(50, 800, 1/4000, 2.)
+    assert copy.deepcopy(settings) == settings
+    assert pickle.loads(pickle.dumps(settings)) == settings
+
+
+def test_as_dict_copy(tmp_path):
+    camera = Camera(**camera_info, root=tmp_path)
+    assert camera._as_dict() == camera_info
+
+    # Changing the returned dictionary must not change the camera's metadata
+    dictionary = camera._as_dict()
+    dictionary["name"] = "Changed"
+    assert camera._as_dict() == camera_info
+
+
+def test_read_from_file_keys(tmp_path):
+    # colour_description is optional
+    camera_info_minimal = {key: value for key, value in camera_info.items() if key != "colour_description"}
+    write_json(camera_info_minimal, tmp_path/"camera_data.json")
+    camera = Camera.read_from_file(tmp_path/"camera_data.json")
+    assert camera.name == camera_info["name"]
+
+    # Missing or unknown keys are rejected
+    camera_info_missing = {key: value for key, value in camera_info.items() if key != "bias"}
+    write_json(camera_info_missing, tmp_path/"camera_data.json")
+    with pytest.raises(ValueError):
+        Camera.read_from_file(tmp_path/"camera_data.json")
+
+    write_json({**camera_info, "ISO": 100}, tmp_path/"camera_data.json")
+    with pytest.raises(ValueError):
+        Camera.read_from_file(tmp_path/"camera_data.json")
+
+
+def test_load_settings(tmp_path):
+    # Create a root folder with a camera information file and a settings file
+    write_json(camera_info, tmp_path/"camera_data.json")
+    (tmp_path/"calibration").mkdir()
+    write_json(settings_info, tmp_path/"calibration"/"settings.json")
+
+    settings = load_settings(tmp_path)
+    assert settings == Settings(50, 800, 1/4000, 2.)
+
+    camera = Camera(**camera_info, root=tmp_path)
+    assert camera.settings == settings
+
+    camera = load_camera(tmp_path)
+    assert camera.root == tmp_path
+    assert camera.settings == settings
+
+
+def test_channel_mask():
+    camera = Camera(**{**camera_info, "image_shape": [5, 7]})
+    mask = camera.channel_mask([1, 3])
+    assert mask.dtype == bool
+    assert np.array_equal(mask, (camera.bayer_map == 1) | (camera.bayer_map == 3))
+
+
+def test_as_dict_from_file(tmp_path):
+    write_json(camera_info, tmp_path/"camera_data.json")
+    camera = load_camera(tmp_path)
+    assert camera._as_dict() == camera_info
+
+    # Changing the returned dictionary must not change the camera's metadata
+    dictionary = camera._as_dict()
+    dictionary["name"] = "Changed"
+    assert camera._as_dict() == camera_info
+
+
+def test_subgrid():
+    camera = Camera(**{**camera_info, "bayer_pattern": [[1, 0], [2, 3]]})
+    data = np.arange(3*24).reshape(3, *camera.image_shape)
+
+    # The sub-grid is a view of the data, matching the demosaicked channel
+    R = camera.subgrid(data, 0)
+    assert np.shares_memory(R, data)
+    assert np.array_equal(R, data[..., ::2, 1::2])
+    assert np.array_equal(R, camera.demosaick(data)[:, 0])
@@ -41,8 +41,9 @@ for tup in walk(folder):
         continue
 
     arrs = io.load_raw_image_multi(folder_here, pattern=raw_pattern)
-    mean = np.full(arrs.shape[1:], np.nan)
-    stds = mean.copy()
+    # Every row is filled in below, so the arrays need not be initialised
+    mean = np.empty(arrs.shape[1:])
+    stds = np.empty(arrs.shape[1:])
     for i, row in enumerate(mean):
         mean[i] = arrs[:,i].mean(axis=0, dtype=np.float32)
         stds[i] = arrs[:,i].std (axis=0, dtype=np.float32)